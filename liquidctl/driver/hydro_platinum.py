@@ -161,8 +161,8 @@ class HydroPlatinum(UsbHidDriver):
 
         self._data.store('pump_mode', _PumpMode[pump_mode.upper()].value)
         res = self._send_set_cooling()
-        fw_version = (res[2] >> 4, res[2] & 0xf, res[3])
-        return [('Firmware version', '%d.%d.%d' % fw_version, '')]
+        fw_version = f'{res[2] >> 4}.{res[2] & 0xf}.{res[3]}'
+        return [('Firmware version', fw_version, '')]
 
     def get_status(self, **kwargs):
         """Get a status report.
@@ -129,10 +129,10 @@ class RgbFusion2(UsbHidDriver):
 
         null = data.index(0, 12)
         dev_name = str(bytes(data[12:null]), 'ascii', errors='replace')
-        fw_version = tuple(data[4:8])
+        fw_version = f'{data[4]}.{data[5]}.{data[6]}.{data[7]}'
         return [
             ('Hardware name', dev_name, ''),
-            ('Firmware version', '%d.%d.%d.%d' % fw_version, ''),
+            ('Firmware version', fw_version, ''),
         ]
 
     def get_status(self, **kwargs):